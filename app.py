@@ -6,21 +6,24 @@ This Flask single-file backend:
 - Uses DATABASE_URL if provided (Railway). Falls back to sqlite in instance/.
 - Exposes endpoints:
   - GET  /api/v1/readings/latest        -> latest reading (JSON)
-  - GET  /api/v1/readings/all           -> list recent readings
+  - GET  /api/v1/readings/all           -> list recent readings (keyset paging via ?after_ts=&after_id=)
   - POST /api/v1/readings               -> create/update reading (requires x-api-key)
+  - POST /api/v1/readings/bulk          -> upsert a JSON array of readings in one statement (requires x-api-key)
   - POST /admin/reset-db                -> DROP ALL TABLES then CREATE TABLES (requires x-api-key)
-  - POST /admin/init-db                 -> create tables if missing (requires x-api-key)
+  - POST /admin/init-db                 -> create missing tables/indexes (requires x-api-key)
 - Model includes the requested fields: detected (bool), range_cm (float), angle_deg (float).
 - Safe-by-default: reset only runs when you call /admin/reset-db with the correct API key.
 - WARNING: /admin/reset-db is destructive — it drops all tables and data.
 
-Run: python3 app.py
+Run: python3 app.py   (USE_GUNICORN=1 to serve via gunicorn.conf.py)
 """
 
 import os
 import uuid
+import sqlite3
+import time
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from io import BytesIO
 import pkgutil
 import importlib.util
@@ -35,9 +38,13 @@ if not hasattr(pkgutil, "get_loader"):
             return None
     pkgutil.get_loader = _compat_get_loader
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from sqlalchemy import MetaData, Table, cast, event, func, inspect, literal_column, select, text, tuple_
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
 # Optional socketio (real-time) — not required for reset/migrations
 try:
@@ -47,6 +54,15 @@ except Exception:
     SocketIO = None
     SOCKETIO_AVAILABLE = False
 
+# Optional orjson (fast JSON) — falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+except Exception:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger("rescue_radar")
@@ -55,6 +71,54 @@ logger = logging.getLogger("rescue_radar")
 app = Flask(__name__)
 CORS(app)
 
+class ReadingsJSONProvider(DefaultJSONProvider):
+    """
+    The app's JSON path (jsonify, request.get_json, app.json.dumps) on orjson when
+    installed; jsonify bodies are orjson's bytes as-is. Naive UTC datetimes render
+    as ISO-8601 with a Z with or without orjson.
+    """
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, datetime):
+            return o.isoformat() + "Z"
+        return DefaultJSONProvider.default(o)
+
+    def _orjson_option(self, sort_keys, indent=False):
+        option = ORJSON_OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        # orjson can honour default/sort_keys; anything else (indent, separators...) goes to stdlib
+        if not ORJSON_AVAILABLE or not kwargs.keys() <= {"default", "sort_keys"}:
+            return super().dumps(obj, **kwargs)
+        option = self._orjson_option(kwargs.get("sort_keys", self.sort_keys))
+        if "default" in kwargs:
+            # a caller's default sees datetimes, as it would under json.dumps
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if not ORJSON_AVAILABLE:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        # same key order / pretty-printing rules as the stdlib path
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default,
+                            option=self._orjson_option(self.sort_keys, indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+app.json = ReadingsJSONProvider(app)
+
 # Socket.IO (if installed)
 if SOCKETIO_AVAILABLE:
     socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
@@ -63,6 +127,15 @@ else:
     socketio = None
     logger.info("ℹ flask_socketio not installed — realtime disabled")
 
+# defined early: config below reads env flags with it
+def parse_bool(v):
+    if v is None:
+        return False
+    if isinstance(v, bool):
+        return v
+    s = str(v).strip().lower()
+    return s in ("1", "true", "yes", "on")
+
 # Instance dir & DB path (sqlite fallback)
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 INSTANCE_DIR = os.path.join(BASE_DIR, "instance")
@@ -80,10 +153,49 @@ else:
     logger.info("Using local SQLite database at %s", sqlite_path)
 
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# resolved once so the upsert path doesn't touch db.engine per request
+db_url = make_url(app.config["SQLALCHEMY_DATABASE_URI"])
+DB_DIALECT = db_url.get_backend_name()
+
+# Connection pool for server databases. pre-ping costs a SELECT 1 per checkout,
+# so it is opt-in (DB_PRE_PING=1); connections are recycled before MySQL's
+# wait_timeout can kill them, and libpq-based Postgres drivers also get TCP keepalives.
+# LIFO checkout keeps reusing the most recently warm connection.
+if DB_DIALECT != "sqlite":
+    engine_opts = {
+        "pool_pre_ping": parse_bool(os.environ.get("DB_PRE_PING")),
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 40)),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+        "pool_use_lifo": True,
+    }
+    if db_url.get_driver_name() in ("psycopg2", "psycopg"):
+        engine_opts["connect_args"] = {
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 3,
+        }
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_opts
 WRITE_API_KEY = os.environ.get("WRITE_API_KEY", "rescue-radar-dev")
+MAX_BULK_READINGS = int(os.environ.get("MAX_BULK_READINGS", 1000))
+LATEST_CACHE_TTL = float(os.environ.get("LATEST_CACHE_TTL", 2.0))
 
 db = SQLAlchemy(app)
 
+@event.listens_for(Engine, "connect")
+def sqlite_pragmas(dbapi_connection, connection_record):
+    # SQLite fallback only: WAL lets readers run while ESP32 writes commit,
+    # and synchronous=NORMAL fsyncs at checkpoints instead of every commit
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 # ---------------- Model ----------------
 class VictimReading(db.Model):
     __tablename__ = "victim_readings"
@@ -104,11 +216,15 @@ class VictimReading(db.Model):
     latitude = db.Column(db.Float)
     longitude = db.Column(db.Float)
 
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    # microseconds on MySQL too, so an upsert that updates always changes the row
+    timestamp = db.Column(db.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql", "mariadb"), default=datetime.utcnow)
+
+    # newest-first listing and its keyset cursor walk this index in order
+    __table_args__ = (db.Index("ix_readings_ts_id", timestamp.desc(), id.desc()),)
 
     def to_dict(self):
+        # timestamp is always a naive UTC datetime written by this service
         ts = self.timestamp
-        iso = ts.isoformat() + "Z" if isinstance(ts, datetime) else str(ts)
         return {
             "id": self.id,
             "victim_id": self.victim_id,
@@ -121,27 +237,155 @@ class VictimReading(db.Model):
             "gas_ppm": self.gas_ppm,
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "timestamp": iso,
+            "timestamp": ts.isoformat() + "Z" if ts is not None else None,
         }
 
 # ---------------- Helpers ----------------
+# indexes older deployments still carry but the model no longer declares
+# (ix_readings_ts_id leads with timestamp and replaces the single-column one)
+LEGACY_INDEXES = {"ix_victim_readings_timestamp": ("timestamp",)}
+
+def ensure_schema():
+    """create_all(), indexes added after the table already existed, legacy index cleanup, MySQL timestamp precision."""
+    db.create_all()
+    for index in VictimReading.__table__.indexes:
+        index.create(bind=db.engine, checkfirst=True)
+
+    # detached stand-in table so the legacy Index never attaches to the model
+    for name, columns in LEGACY_INDEXES.items():
+        legacy = Table(VictimReading.__tablename__, MetaData(), *(db.Column(col) for col in columns))
+        db.Index(name, *legacy.c).drop(bind=db.engine, checkfirst=True)
+
+    # tables created before the column became DATETIME(6) hold whole seconds
+    if DB_DIALECT in ("mysql", "mariadb"):
+        columns = {c["name"]: c["type"] for c in inspect(db.engine).get_columns(VictimReading.__tablename__)}
+        if getattr(columns["timestamp"], "fsp", None) != 6:
+            with db.engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {VictimReading.__tablename__} MODIFY `timestamp` DATETIME(6)"))
+
 def require_key(req):
     return req.headers.get("x-api-key") == WRITE_API_KEY
 
-def parse_bool(v):
-    if v is None:
-        return False
-    if isinstance(v, bool):
-        return v
-    s = str(v).strip().lower()
-    return s in ("1", "true", "yes", "on")
-
 def to_float(v):
     try:
         return float(v) if v is not None else None
     except Exception:
         return None
 
+# (monotonic time, payload) of the newest reading, served by /readings/latest.
+# Writes in this process refresh it immediately; the TTL bounds staleness
+# against writers in other processes.
+_latest_cache = (0.0, None)
+
+def cache_latest(reading_dict):
+    global _latest_cache
+    _latest_cache = (time.monotonic(), reading_dict)
+
+def invalidate_latest():
+    global _latest_cache
+    _latest_cache = (0.0, None)
+
+# sensor columns that keep their stored value when an update doesn't carry them
+MERGE_COLUMNS = (
+    "range_cm", "angle_deg", "distance_cm", "temperature_c",
+    "humidity_pct", "gas_ppm", "latitude", "longitude",
+)
+
+def parse_reading(data, now):
+    """
+    Map a sensor payload (new + legacy keys) onto VictimReading column values.
+    Scalar victim_ids are stored as strings; a list/object raises ValueError.
+    """
+    victim_id = data.get("victim_id")
+    if isinstance(victim_id, (list, dict)):
+        raise ValueError("victim_id must be a string or number")
+    range_cm = to_float(data.get("range_cm", data.get("range", data.get("distance_cm", data.get("distance")))))
+    distance_cm = to_float(data.get("distance_cm", data.get("distance")))
+    return {
+        "victim_id": str(victim_id) if victim_id not in (None, "") else f"vic-{uuid.uuid4().hex[:8]}",
+        "detected": parse_bool(data.get("detected", data.get("person_detected", data.get("found")))),
+        "range_cm": range_cm if range_cm is not None else distance_cm,
+        "angle_deg": to_float(data.get("angle_deg", data.get("angle"))),
+        "distance_cm": distance_cm,
+        "temperature_c": to_float(data.get("temperature")),
+        "humidity_pct": to_float(data.get("humidity")),
+        "gas_ppm": to_float(data.get("gas")),
+        "latitude": to_float(data.get("latitude")),
+        "longitude": to_float(data.get("longitude")),
+        "timestamp": now,
+    }
+
+def merge_into(reading, values):
+    reading.detected = values["detected"]
+    for key in MERGE_COLUMNS:
+        if values[key] is not None:
+            setattr(reading, key, values[key])
+    reading.timestamp = values["timestamp"]
+
+def build_upsert(rows):
+    """
+    Single INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE keyed on victim_id.
+    Returns None when the dialect has no native upsert.
+    """
+    table = VictimReading.__table__
+    if DB_DIALECT == "postgresql":
+        stmt = postgresql.insert(table).values(rows)
+        incoming = stmt.excluded
+    elif DB_DIALECT == "sqlite":
+        stmt = sqlite.insert(table).values(rows)
+        incoming = stmt.excluded
+    elif DB_DIALECT in ("mysql", "mariadb"):
+        stmt = mysql.insert(table).values(rows)
+        incoming = stmt.inserted
+    else:
+        return None
+
+    updates = {"detected": incoming.detected, "timestamp": incoming.timestamp}
+    updates.update({key: func.coalesce(incoming[key], table.c[key]) for key in MERGE_COLUMNS})
+    if DB_DIALECT in ("mysql", "mariadb"):
+        return stmt.on_duplicate_key_update(updates)
+    return stmt.on_conflict_do_update(index_elements=[table.c.victim_id], set_=updates)
+
+def upsert_reading(values):
+    """
+    Create or update one reading without looking the victim up first.
+    Returns (reading, action) where action is "CREATED" or "UPDATED".
+    """
+    stmt = build_upsert([values])
+    if stmt is None:
+        reading = VictimReading.query.filter_by(victim_id=values["victim_id"]).first()
+        if reading:
+            merge_into(reading, values)
+            return reading, "UPDATED"
+        reading = VictimReading(**values)
+        db.session.add(reading)
+        return reading, "CREATED"
+
+    table = VictimReading.__table__
+    if DB_DIALECT == "postgresql":
+        # xmax is 0 only on a tuple this statement inserted
+        stmt = stmt.returning(*table.c, literal_column("xmax = 0").label("inserted"))
+        row = db.session.execute(stmt).mappings().one()
+        created = row["inserted"]
+    elif DB_DIALECT == "sqlite":
+        # RETURNING (SQLite >= 3.35) hands whole-number REALs back as ints
+        columns = [cast(c, c.type).label(c.key) if isinstance(c.type, db.Float) else c for c in table.c]
+        # insert-only first: just the request that creates the row gets it back,
+        # so two concurrent first POSTs can't both report CREATED
+        insert = sqlite.insert(table).values(values).on_conflict_do_nothing(index_elements=[table.c.victim_id])
+        row = db.session.execute(insert.returning(*columns)).mappings().one_or_none()
+        created = row is not None
+        if not created:
+            row = db.session.execute(stmt.returning(*columns)).mappings().one()
+    else:
+        # no RETURNING on MySQL. With CLIENT_FOUND_ROWS an insert counts 1 and a
+        # changed row 2; the DATETIME(6) timestamp means every update changes it
+        created = db.session.execute(stmt).rowcount == 1
+        row = db.session.execute(select(table).where(table.c.victim_id == values["victim_id"])).mappings().one()
+
+    reading = VictimReading(**{c.key: row[c.key] for c in table.c})
+    return reading, "CREATED" if created else "UPDATED"
+
 # ---------------- Routes ----------------
 @app.route("/")
 def home():
@@ -172,90 +416,151 @@ def create_reading():
         return jsonify({"error": "Unauthorized"}), 401
 
     data = request.get_json(silent=True) or {}
-
-    # accept new + legacy keys
-    detected = parse_bool(data.get("detected", data.get("person_detected", data.get("found"))))
-    raw_range = data.get("range_cm", data.get("range", data.get("distance_cm", data.get("distance"))))
-    range_cm = to_float(raw_range)
-    raw_angle = data.get("angle_deg", data.get("angle"))
-    angle_deg = to_float(raw_angle)
-
-    distance_cm = to_float(data.get("distance_cm", data.get("distance")))
-    temperature = to_float(data.get("temperature"))
-    humidity = to_float(data.get("humidity"))
-    gas = to_float(data.get("gas"))
-    latitude = to_float(data.get("latitude"))
-    longitude = to_float(data.get("longitude"))
-
-    victim_id = data.get("victim_id") or f"vic-{uuid.uuid4().hex[:8]}"
-
-    reading = VictimReading.query.filter_by(victim_id=victim_id).first()
-    if reading:
-        reading.detected = detected
-        reading.range_cm = range_cm if range_cm is not None else reading.range_cm
-        reading.angle_deg = angle_deg if angle_deg is not None else reading.angle_deg
-        reading.distance_cm = distance_cm if distance_cm is not None else reading.distance_cm
-        reading.temperature_c = temperature if temperature is not None else reading.temperature_c
-        reading.humidity_pct = humidity if humidity is not None else reading.humidity_pct
-        reading.gas_ppm = gas if gas is not None else reading.gas_ppm
-        reading.latitude = latitude if latitude is not None else reading.latitude
-        reading.longitude = longitude if longitude is not None else reading.longitude
-        reading.timestamp = datetime.utcnow()
-        action = "UPDATED"
-    else:
-        reading = VictimReading(
-            victim_id=victim_id,
-            detected=detected,
-            range_cm=range_cm if range_cm is not None else distance_cm,
-            angle_deg=angle_deg,
-            distance_cm=distance_cm,
-            temperature_c=temperature,
-            humidity_pct=humidity,
-            gas_ppm=gas,
-            latitude=latitude,
-            longitude=longitude,
-            timestamp=datetime.utcnow(),
-        )
-        db.session.add(reading)
-        action = "CREATED"
+    try:
+        values = parse_reading(data, datetime.utcnow())
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    victim_id = values["victim_id"]
 
     try:
+        reading, action = upsert_reading(values)
         db.session.commit()
     except Exception:
         db.session.rollback()
         logger.exception("DB commit failed")
         return jsonify({"error": "database error"}), 500
 
+    reading_dict = reading.to_dict()
+    cache_latest(reading_dict)
+
     # Emit socket event if available
     if SOCKETIO_AVAILABLE:
         try:
-            socketio.emit("reading_update", {"reading": reading.to_dict()})
+            socketio.emit("reading_update", {"reading": reading_dict})
         except Exception:
             logger.exception("socket emit failed")
 
     logger.info("%s victim %s detected=%s range=%s angle=%s", action, victim_id, reading.detected, reading.range_cm, reading.angle_deg)
-    return jsonify({"status": "ok", "action": action, "reading": reading.to_dict()}), 200
+    return jsonify({"status": "ok", "action": action, "reading": reading_dict}), 200
+
+@app.route("/api/v1/readings/bulk", methods=["POST"])
+def create_readings_bulk():
+    """
+    Upsert a JSON array of readings (or {"readings": [...]}) in one statement.
+    The stored rows are read back by victim_id and each is emitted as the same
+    Socket.IO "reading_update" event the single-reading endpoint sends.
+    """
+    if not require_key(request):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("readings")
+    if not isinstance(data, list) or not data or not all(isinstance(item, dict) for item in data):
+        return jsonify({"error": "expected a non-empty JSON array of readings"}), 400
+    if len(data) > MAX_BULK_READINGS:
+        return jsonify({"error": f"at most {MAX_BULK_READINGS} readings per request"}), 413
+
+    # one row per victim - ON CONFLICT can't touch the same row twice in one statement.
+    # Later items fold over earlier ones the way merge_into() does across requests.
+    now = datetime.utcnow()
+    rows = {}
+    for item in data:
+        try:
+            values = parse_reading(item, now)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        previous = rows.get(values["victim_id"])
+        if previous is not None:
+            for key in MERGE_COLUMNS:
+                if values[key] is None:
+                    values[key] = previous[key]
+        rows[values["victim_id"]] = values
+    rows = list(rows.values())
+
+    try:
+        stmt = build_upsert(rows)
+        if stmt is not None:
+            db.session.execute(stmt)
+        else:
+            existing = {
+                r.victim_id: r
+                for r in VictimReading.query.filter(VictimReading.victim_id.in_([v["victim_id"] for v in rows]))
+            }
+            for values in rows:
+                if values["victim_id"] in existing:
+                    merge_into(existing[values["victim_id"]], values)
+                else:
+                    db.session.add(VictimReading(**values))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("DB bulk upsert failed")
+        return jsonify({"error": "database error"}), 500
+
+    # ids aren't returned by the bulk statement; let the next read repopulate
+    invalidate_latest()
+
+    if SOCKETIO_AVAILABLE:
+        try:
+            stored = VictimReading.query.filter(VictimReading.victim_id.in_([v["victim_id"] for v in rows]))
+            for reading in stored:
+                socketio.emit("reading_update", {"reading": reading.to_dict()})
+        except Exception:
+            logger.exception("socket emit failed")
+    logger.info("BULK upserted %d readings", len(rows))
+    return jsonify({"status": "ok", "count": len(rows)}), 200
 
 @app.route("/api/v1/readings/latest", methods=["GET"])
 def latest_reading():
+    cached_at, reading_dict = _latest_cache
+    if reading_dict is not None and time.monotonic() - cached_at < LATEST_CACHE_TTL:
+        return jsonify({"reading": reading_dict}), 200
+
     latest = VictimReading.query.order_by(VictimReading.timestamp.desc()).first()
     if not latest:
         return jsonify({"reading": None}), 200
-    return jsonify({"reading": latest.to_dict()}), 200
+    reading_dict = latest.to_dict()
+    cache_latest(reading_dict)
+    return jsonify({"reading": reading_dict}), 200
 
 @app.route("/api/v1/readings/all", methods=["GET"])
 def all_readings():
-    page = request.args.get("page", 1, type=int)
-    per_page = min(request.args.get("per_page", 50, type=int), 500)
-    q = VictimReading.query.order_by(VictimReading.timestamp.desc())
-    items = q.limit(per_page).offset((page - 1) * per_page).all()
-    total = q.count()
-    return jsonify({
-        "readings": [r.to_dict() for r in items],
-        "page": page,
-        "per_page": per_page,
-        "total": total,
-    }), 200
+    """
+    Newest first. Pass the previous response's "next" cursor back as
+    ?after_ts=...&after_id=... to page without OFFSET or COUNT(*).
+    Legacy ?page= paging is still accepted.
+    """
+    per_page = max(1, min(request.args.get("per_page", 50, type=int), 500))
+    # plain column rows: no ORM hydration or per-row to_dict()
+    table = VictimReading.__table__
+    q = select(table).order_by(table.c.timestamp.desc(), table.c.id.desc()).limit(per_page)
+
+    if "after_ts" in request.args or "after_id" in request.args:
+        # a cursor that's half there or unparseable is an error, not "start over"
+        try:
+            after_ts = datetime.fromisoformat(request.args["after_ts"].rstrip("Z"))
+            after_id = int(request.args["after_id"])
+        except (KeyError, ValueError):
+            return jsonify({"error": "after_ts (ISO-8601) and after_id (integer) must be given together"}), 400
+        if after_ts.tzinfo is not None:
+            # the column holds naive UTC
+            after_ts = after_ts.astimezone(timezone.utc).replace(tzinfo=None)
+        q = q.where(tuple_(table.c.timestamp, table.c.id) < (after_ts, after_id))
+        body = {"per_page": per_page}
+    else:
+        page = request.args.get("page", 1, type=int)
+        q = q.offset((page - 1) * per_page)
+        total = db.session.scalar(select(func.count()).select_from(table))
+        body = {"page": page, "per_page": per_page, "total": total}
+
+    readings = [dict(r) for r in db.session.execute(q).mappings()]
+    body["readings"] = readings
+    body["next"] = (
+        {"after_ts": readings[-1]["timestamp"], "after_id": readings[-1]["id"]}
+        if readings and len(readings) == per_page else None
+    )
+    return jsonify(body), 200
 
 # ---------------- Admin (destructive) ----------------
 @app.route("/admin/reset-db", methods=["POST"])
@@ -272,6 +577,7 @@ def reset_db():
         logger.warning("ADMIN RESET DB requested - dropping all tables")
         # Drop all tables (destructive)
         db.drop_all()
+        invalidate_latest()
         # Recreate tables from models
         db.create_all()
         logger.warning("ADMIN RESET DB completed - new schema created")
@@ -285,7 +591,7 @@ def init_db():
     if not require_key(request):
         return jsonify({"error": "Unauthorized"}), 401
     try:
-        db.create_all()
+        ensure_schema()
         return jsonify({"status": "ok"}), 200
     except Exception:
         logger.exception("init-db failed")
@@ -296,11 +602,18 @@ if __name__ == "__main__":
     # create tables on startup (non-destructive)
     with app.app_context():
         try:
-            db.create_all()
+            ensure_schema()
             logger.info("DB tables ensured (did not drop existing)")
         except Exception:
             logger.exception("db.create_all failed on startup")
 
+    if parse_bool(os.environ.get("USE_GUNICORN")):
+        # hand off to the production server setup (see gunicorn.conf.py / Procfile)
+        logger.info("USE_GUNICORN set - exec'ing gunicorn")
+        os.execvp("gunicorn", [
+            "gunicorn", "--chdir", BASE_DIR, "-c", os.path.join(BASE_DIR, "gunicorn.conf.py"), "app:app",
+        ])
+
     port = int(os.environ.get("PORT", 5001))
     # Run with socketio if available (keeps compatibility)
     if SOCKETIO_AVAILABLE:
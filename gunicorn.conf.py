@@ -0,0 +1,19 @@
+"""
+Rescue Radar - gunicorn settings (picked up by the Procfile).
+
+One worker: Socket.IO runs without a message queue, so every client has to
+land on the same process. The default eventlet worker keeps long-lived
+connections as green threads; GUNICORN_WORKER_CLASS=gthread switches to a
+thread pool sized by GUNICORN_THREADS instead.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "eventlet")
+workers = 1
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+# keep idle client sockets open longer than typical proxy timeouts (Railway ~60s)
+keepalive = 75